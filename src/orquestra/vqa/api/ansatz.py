@@ -2,23 +2,38 @@
 # © Copyright 2022 Zapata Computing Inc.
 ################################################################################
 from abc import ABC
-from typing import Callable, Optional
+from typing import Callable, FrozenSet, Optional, Tuple
 
 import numpy as np
 import sympy
 from orquestra.quantum.circuits import Circuit, natural_key_revlex
 from orquestra.quantum.typing import SupportsLessThan
-from orquestra.quantum.utils import create_symbols_map
 from overrides import EnforceOverrides
 
-from .ansatz_utils import ansatz_property
+from .ansatz_utils import (
+    _MISSING,
+    _is_unchanged,
+    _PositionalCircuitBinder,
+    ansatz_property,
+)
 
 SymbolsSortKey = Callable[[sympy.Symbol], SupportsLessThan]
 
 
 class Ansatz(ABC, EnforceOverrides):
 
+    # Cached circuit and the base backing field are stored in slots, which are
+    # cheaper to read and write than entries in instance __dict__.
+    __slots__ = (
+        "_parametrized_circuit",
+        "_number_of_layers",
+        "_circuit_binder_cache",
+    )
+
     supports_parametrized_circuits: Optional[bool] = None
+    # Names of attributes invalidating the parametrized circuit when set. Populated
+    # by `ansatz_property` and `invalidates_parametrized_circuit`.
+    _INVALIDATING_ATTRS: FrozenSet[str] = frozenset()
     number_of_layers = ansatz_property("number_of_layers")
 
     def __init__(self, number_of_layers: int):
@@ -45,13 +60,46 @@ class Ansatz(ABC, EnforceOverrides):
             raise ValueError("number_of_layers must be non-negative.")
         self.number_of_layers = number_of_layers
         self._parametrized_circuit: Optional[Circuit] = None
+        self._circuit_binder_cache: Optional[
+            Tuple[Circuit, SymbolsSortKey, _PositionalCircuitBinder]
+        ] = None
+
+    def __setattr__(self, name, value):
+        # There is nothing to invalidate until the circuit is built, so a sequence of
+        # updates done before that (e.g. in __init__) skips comparing old and new
+        # values altogether.
+        if (
+            name in type(self)._INVALIDATING_ATTRS
+            and getattr(self, "_parametrized_circuit", None) is not None
+        ):
+            old_value = getattr(self, name, _MISSING)
+            super().__setattr__(name, value)
+            if not _is_unchanged(old_value, value):
+                object.__setattr__(self, "_parametrized_circuit", None)
+        else:
+            super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # The binder cache holds lambdified functions and possibly a locally defined
+        # sort key, neither of which can be pickled. It is rebuilt on the next call to
+        # get_executable_circuit, so it is left out of the pickled state.
+        slots_state = {
+            name: getattr(self, name)
+            for name in Ansatz.__slots__
+            if hasattr(self, name)
+        }
+        slots_state["_circuit_binder_cache"] = None
+        return dict(self.__dict__), slots_state
 
     @property
     def parametrized_circuit(self) -> Circuit:
         """Returns a parametrized circuit if given ansatz supports it."""
-        if self._parametrized_circuit is None:
+        # The cached circuit is read once, the hot path is a single slot lookup.
+        circuit = self._parametrized_circuit
+        if circuit is None:
             if self.supports_parametrized_circuits:
-                self._parametrized_circuit = self._generate_circuit()
+                circuit = self._generate_circuit()
+                self._parametrized_circuit = circuit
             else:
                 raise (
                     NotImplementedError(
@@ -60,7 +108,7 @@ class Ansatz(ABC, EnforceOverrides):
                         )
                     )
                 )
-        return self._parametrized_circuit
+        return circuit
 
     @property
     def number_of_qubits(self) -> int:
@@ -83,12 +131,7 @@ class Ansatz(ABC, EnforceOverrides):
         if params is None:
             raise Exception("Parameters can't be None for executable circuit.")
         if self.supports_parametrized_circuits:
-            symbols = sorted(
-                self.parametrized_circuit.free_symbols, key=self.symbols_sort_key
-            )
-            symbols_map = create_symbols_map(symbols, params)
-            executable_circuit = self.parametrized_circuit.bind(symbols_map)
-            return executable_circuit
+            return self._get_circuit_binder().bind(params)
         else:
             return self._generate_circuit(params)
 
@@ -96,6 +139,22 @@ class Ansatz(ABC, EnforceOverrides):
     def symbols_sort_key(self) -> SymbolsSortKey:
         return natural_key_revlex
 
+    def _get_circuit_binder(self) -> _PositionalCircuitBinder:
+        """Returns binder of parametrized circuit, with symbols sorted using
+        symbols_sort_key.
+
+        The binder is created only once per parametrized circuit, as the same circuit
+        is bound to new parameters in every iteration of the optimization loop.
+        """
+        circuit = self.parametrized_circuit
+        sort_key = self.symbols_sort_key
+        cache = self._circuit_binder_cache
+        if cache is None or cache[0] is not circuit or cache[1] is not sort_key:
+            symbols = sorted(circuit.free_symbols, key=sort_key)
+            cache = (circuit, sort_key, _PositionalCircuitBinder(circuit, symbols))
+            self._circuit_binder_cache = cache
+        return cache[2]
+
     def _generate_circuit(self, params: Optional[np.ndarray] = None) -> Circuit:
         """Returns a circuit represention of the ansatz.
 
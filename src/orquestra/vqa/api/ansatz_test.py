@@ -7,8 +7,10 @@ Note that this file won't be executed on its own by pytest.
 You need to define your own test cases that inherit from the ones defined here.
 """
 
+import pickle
 
 import numpy as np
+from orquestra.quantum.utils import create_symbols_map
 
 
 class AnsatzTests:
@@ -30,6 +32,17 @@ class AnsatzTests:
             # Then
             assert ansatz._parametrized_circuit is None
 
+    def test_setting_same_number_of_layers_keeps_parametrized_circuit(self, ansatz):
+        if ansatz.supports_parametrized_circuits:
+            # Given
+            circuit = ansatz.parametrized_circuit
+
+            # When
+            ansatz.number_of_layers = ansatz.number_of_layers
+
+            # Then
+            assert ansatz._parametrized_circuit is circuit
+
     # TODO: check with QCBM?
     def test_number_of_params_greater_than_0(self, ansatz):
         if ansatz.number_of_layers != 0:
@@ -58,3 +71,49 @@ class AnsatzTests:
         # Then
         for operation in circuit.operations:
             assert len(operation.free_symbols) == 0
+
+    def test_get_executable_circuit_matches_bound_parametrized_circuit(self, ansatz):
+        if ansatz.supports_parametrized_circuits:
+            # Given
+            params = np.random.random([ansatz.number_of_params])
+            symbols = sorted(
+                ansatz.parametrized_circuit.free_symbols, key=ansatz.symbols_sort_key
+            )
+            target_circuit = ansatz.parametrized_circuit.bind(
+                create_symbols_map(symbols, params)
+            )
+
+            # When
+            circuit = ansatz.get_executable_circuit(params)
+
+            # Then
+            assert len(circuit.operations) == len(target_circuit.operations)
+            for operation, target_operation in zip(
+                circuit.operations, target_circuit.operations
+            ):
+                assert operation.qubit_indices == target_operation.qubit_indices
+                np.testing.assert_allclose(
+                    np.array(operation.params, dtype=complex),
+                    np.array(target_operation.params, dtype=complex),
+                )
+
+    def test_ansatz_can_be_pickled_after_getting_executable_circuit(self, ansatz):
+        # Given
+        params = np.random.random([ansatz.number_of_params])
+        target_circuit = ansatz.get_executable_circuit(params)
+
+        # When
+        unpickled_ansatz = pickle.loads(pickle.dumps(ansatz))
+        circuit = unpickled_ansatz.get_executable_circuit(params)
+
+        # Then
+        assert unpickled_ansatz.number_of_layers == ansatz.number_of_layers
+        assert len(circuit.operations) == len(target_circuit.operations)
+        for operation, target_operation in zip(
+            circuit.operations, target_circuit.operations
+        ):
+            assert operation.qubit_indices == target_operation.qubit_indices
+            np.testing.assert_allclose(
+                np.array(operation.params, dtype=complex),
+                np.array(target_operation.params, dtype=complex),
+            )
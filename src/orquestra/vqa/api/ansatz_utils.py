@@ -2,27 +2,45 @@
 # © Copyright 2022 Zapata Computing Inc.
 ################################################################################
 from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
+import sympy
+from orquestra.quantum.circuits import Circuit
 
+_MISSING = object()
 
-class _InvalidatingSetter(object):
-    """Setter descriptor that sets target object's _parametrized_circuit to None.
+# Values of these types can't be modified in place, so they can't be aliased by the
+# ansatz and changed behind its back. Tuples are excluded, as their elements could
+# still be mutable.
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, frozenset)
 
-    The descriptor uses __get__ and __set__ methods. Both of them accept ansatz as the
-    first argument (in this case).  We just forward the __get__, but in __set__ we set
-    obj._parametrized_circuit to None.
+
+def _is_unchanged(old_obj, new_obj) -> bool:
+    """Check if assigning new_obj in place of old_obj leaves the ansatz unchanged.
+
+    Only immutable values are compared. Mutable ones (e.g. arrays or operators) could
+    have been modified in place through an alias, so they always count as changed.
     """
+    return (
+        type(old_obj) is type(new_obj)
+        and isinstance(new_obj, _IMMUTABLE_TYPES)
+        and old_obj == new_obj
+    )
 
-    def __init__(self, target):
-        self.target = target
 
-    def __get__(self, ansatz, obj_type):
-        return self.target.__get__(ansatz, obj_type)
+class _InvalidatingProperty(property):
+    """Property that invalidates ansatz's _parametrized_circuit when it is set.
+
+    Instead of wrapping the setter, the property registers its name in the
+    _INVALIDATING_ATTRS of the class it is defined in. Ansatz.__setattr__ then sets
+    _parametrized_circuit to None whenever one of the registered attributes is set.
+    """
 
-    def __set__(self, ansatz, new_obj):
-        self.target.__set__(ansatz, new_obj)
-        ansatz._parametrized_circuit = None
+    def __set_name__(self, owner, name):
+        owner._INVALIDATING_ATTRS = getattr(
+            owner, "_INVALIDATING_ATTRS", frozenset()
+        ) | {name}
 
 
 def invalidates_parametrized_circuit(target):
@@ -32,8 +50,11 @@ def invalidates_parametrized_circuit(target):
     used.
     """
     if isinstance(target, property):
-        # If we are dealing with a property, return our modified descriptor.
-        return _InvalidatingSetter(target)
+        # If we are dealing with a property, return the same property registering
+        # itself as invalidating.
+        return _InvalidatingProperty(
+            target.fget, target.fset, target.fdel, target.__doc__
+        )
     else:
         # Methods are functions that take instance as a first argument
         # They only change to "bound" methods once the object is instantiated
@@ -42,8 +63,9 @@ def invalidates_parametrized_circuit(target):
         def _wrapper(ansatz, *args, **kwargs):
             # Pass through the arguments, store the returned value for later use
             return_value = target(ansatz, *args, **kwargs)
-            # Invalidate circuit
-            ansatz._parametrized_circuit = None
+            # Invalidate circuit. Using object.__setattr__ directly bypasses
+            # Ansatz.__setattr__, which has nothing to do for this attribute.
+            object.__setattr__(ansatz, "_parametrized_circuit", None)
             # Return original result
             return return_value
 
@@ -71,7 +93,21 @@ class DynamicProperty:
 
 
 def ansatz_property(name: str, default_value=None):
-    return _InvalidatingSetter(DynamicProperty(name, default_value))
+    # Behaves like DynamicProperty, but the accessors are passed to the property
+    # directly instead of forwarding to another descriptor.
+    attrname = f"_{name}"
+
+    def _get(ansatz):
+        try:
+            return getattr(ansatz, attrname)
+        except AttributeError:
+            setattr(ansatz, attrname, default_value)
+            return default_value
+
+    def _set(ansatz, new_obj):
+        setattr(ansatz, attrname, new_obj)
+
+    return _InvalidatingProperty(_get, _set)
 
 
 def combine_ansatz_params(params1: np.ndarray, params2: np.ndarray) -> np.ndarray:
@@ -85,3 +121,82 @@ def combine_ansatz_params(params1: np.ndarray, params2: np.ndarray) -> np.ndarra
         numpy.ndarray: the combined parameters
     """
     return np.concatenate((params1, params2))
+
+
+class _PositionalCircuitBinder:
+    """Binds parameters of a parametrized circuit given as a vector.
+
+    Circuit.bind substitutes symbols in every gate using sympy, which is slow when the
+    same circuit is bound to new parameters in every iteration of an optimization
+    loop. Instead, the circuit is compiled once: each gate parameter is looked up in
+    one of three sources. Parameters which are plain symbols pick the corresponding
+    element of the parameter vector, more complex expressions pick the output of a
+    single function lambdified from all of them, and remaining parameters are
+    constants. Operations without free symbols are reused as they are.
+
+    Args:
+        circuit: parametrized circuit to be bound.
+        symbols: free symbols of the circuit. Parameters passed to bind are assigned
+            to the symbols in this order.
+    """
+
+    _PARAMS, _EXPRESSIONS, _CONSTANTS = range(3)
+
+    def __init__(self, circuit: Circuit, symbols: List[sympy.Symbol]):
+        self.symbols = symbols
+        self._n_qubits = circuit.n_qubits
+        self._operations = list(circuit.operations)
+        symbol_indices = {symbol: index for index, symbol in enumerate(symbols)}
+        expression_indices: Dict[sympy.Expr, int] = {}
+        self._constants: List[Any] = []
+
+        # For every operation with free symbols, position of the operation and
+        # (source, index) pair for each of its parameters.
+        self._param_sources: List[Tuple[int, List[Tuple[int, int]]]] = []
+        for position, operation in enumerate(self._operations):
+            if not operation.free_symbols:
+                continue
+            param_sources = []
+            for param in operation.params:
+                if isinstance(param, sympy.Symbol):
+                    param_sources.append((self._PARAMS, symbol_indices[param]))
+                elif isinstance(param, sympy.Expr) and param.free_symbols:
+                    index = expression_indices.setdefault(
+                        param, len(expression_indices)
+                    )
+                    param_sources.append((self._EXPRESSIONS, index))
+                else:
+                    param_sources.append((self._CONSTANTS, len(self._constants)))
+                    self._constants.append(param)
+            self._param_sources.append((position, param_sources))
+
+        # All expressions are evaluated by a single function, lambdifying them one
+        # by one is considerably slower. Gate parameters are plain arithmetic, so
+        # numpy is enough; sympy's default modules would also import scipy, which
+        # makes the first lambdify in a process much slower.
+        self._evaluate_expressions: Optional[Callable[..., List[Any]]] = (
+            sympy.lambdify(symbols, list(expression_indices), modules="numpy")
+            if expression_indices
+            else None
+        )
+
+    def bind(self, params: np.ndarray) -> Circuit:
+        if len(params) != len(self.symbols):
+            raise ValueError(
+                "Length of symbols: {0} doesn't match length of params: {1}".format(
+                    len(self.symbols), len(params)
+                )
+            )
+        params_list = np.asarray(params).tolist()
+        expression_values = (
+            []
+            if self._evaluate_expressions is None
+            else self._evaluate_expressions(*params_list)
+        )
+        sources = (params_list, expression_values, self._constants)
+        operations = list(self._operations)
+        for position, param_sources in self._param_sources:
+            operations[position] = operations[position].replace_params(
+                tuple(sources[source][index] for source, index in param_sources)
+            )
+        return Circuit(operations, self._n_qubits)
@@ -70,23 +70,28 @@ def _calculate_expectation_value_for_distribution(
 ) -> float:
 
     # Calculates expectation value per bitstring
-    expectation_values_per_bitstring = {}
-    for bitstring in distribution.distribution_dict:
-        evals = Measurements([bitstring]).get_expectation_values(  # type: ignore
-            operator, use_bessel_correction=False
-        )
-        expectation_values_per_bitstring[bitstring] = np.sum(evals.values)
+    bitstrings = list(distribution.distribution_dict)
+    expectation_values_per_bitstring = np.array(
+        [
+            np.sum(
+                Measurements([bitstring])  # type: ignore
+                .get_expectation_values(operator, use_bessel_correction=False)
+                .values
+            )
+            for bitstring in bitstrings
+        ]
+    )
+    probabilities = np.array(
+        [distribution.distribution_dict[bitstring] for bitstring in bitstrings]
+    )
+
+    # For the i-th sampled bitstring, compute exp(-alpha E_i) See equation 2 in the
+    # original paper.
+    exponentiated_values = np.exp(-alpha * expectation_values_per_bitstring)
 
-    cumulative_value = 0.0
     # Get total expectation value (mean of expectation values of all bitstrings
     # weighted by distribution)
-    for bitstring in expectation_values_per_bitstring:
-        prob = distribution.distribution_dict[bitstring]
-
-        # For the i-th sampled bitstring, compute exp(-alpha E_i) See equation 2 in the
-        # original paper.
-        expectation_value = np.exp(-alpha * expectation_values_per_bitstring[bitstring])
-        cumulative_value += prob * expectation_value
+    cumulative_value = np.dot(probabilities, exponentiated_values)
 
     final_value = -np.log(cumulative_value)
 
@@ -2,7 +2,7 @@
 # © Copyright 2021-2022 Zapata Computing Inc.
 ################################################################################
 
-import copy
+from itertools import chain
 from typing import List, Tuple, cast
 
 import numpy as np
@@ -147,16 +147,10 @@ def _group_comeasureable_terms_greedy_sorted(
     return group_comeasureable_terms_greedy(qubit_operator, True)
 
 
-def _calculate_variance_upper_bound(group: QubitOperator) -> float:
-    coefficients = np.array(list(group.terms.values()))
-    return np.sum(coefficients**2)
-
-
-def _remove_constant_term_from_group(group: QubitOperator) -> QubitOperator:
-    new_group = copy.deepcopy(group)
-    if new_group.terms.get(()):
-        del new_group.terms[()]
-    return new_group
+def _get_flat_coefficients(groups: List[QubitOperator]) -> np.ndarray:
+    # The dtype is inferred from the coefficients, so that complex ones (including
+    # numpy complex scalars) keep their imaginary parts.
+    return np.array(list(chain.from_iterable(group.terms.values() for group in groups)))
 
 
 def compute_group_variances(
@@ -176,11 +170,24 @@ def compute_group_variances(
         frame_variances: A Numpy array of the computed variances for each frame
     """
 
+    # Coefficients of all groups are stored in a single flat array, and each group
+    # is identified by the offset of its first term. This allows computing variances
+    # of all groups at once instead of iterating over the groups.
+    group_sizes = np.array([len(group.terms) for group in groups], dtype=np.int64)
+    group_offsets = np.cumsum(group_sizes) - group_sizes
+    coefficients = _get_flat_coefficients(groups)
+
     if expecval is None:
-        groups = [_remove_constant_term_from_group(group) for group in groups]
-        frame_variances = [_calculate_variance_upper_bound(group) for group in groups]
+        # Constant terms have zero variance, variances of remaining terms are
+        # bounded by 1.
+        pauli_variances = np.ones(len(coefficients))
+        constant_term_indices = [
+            offset + list(group.terms).index(())
+            for offset, group in zip(group_offsets.tolist(), groups)
+            if () in group.terms
+        ]
+        pauli_variances[constant_term_indices] = 0.0
     else:
-        group_sizes = np.array([len(group.terms.keys()) for group in groups])
         if np.sum(group_sizes) != len(expecval.values):
             raise ValueError(
                 "Number of expectation values should be the same as number of terms."
@@ -192,13 +199,15 @@ def compute_group_variances(
             raise ValueError("Expectation values should have values between -1 and 1.")
 
         pauli_variances = 1.0 - real_expecval.values**2
-        frame_variances = []
-        for i, group in enumerate(groups):
-            coeffs = np.array(list(group.terms.values()))
-            offset = 0 if i == 0 else np.sum(group_sizes[:i])
-            pauli_variances_for_group = pauli_variances[
-                offset : offset + group_sizes[i]
-            ]
-            frame_variances.append(np.sum(coeffs**2 * pauli_variances_for_group))
-
-    return np.array(frame_variances)
+
+    weighted_variances = coefficients**2 * pauli_variances
+    frame_variances = np.zeros(len(groups), dtype=weighted_variances.dtype)
+    # Empty groups have to be skipped, since np.add.reduceat doesn't produce zeros
+    # for empty slices.
+    non_empty = group_sizes > 0
+    if non_empty.any():
+        frame_variances[non_empty] = np.add.reduceat(
+            weighted_variances, group_offsets[non_empty]
+        )
+
+    return frame_variances
@@ -1,14 +1,12 @@
 ################################################################################
 # © Copyright 2021-2022 Zapata Computing Inc.
 ################################################################################
-
 from typing import List, Optional, Tuple, cast
 
 import numpy as np
 from orquestra.quantum.api.estimation import EstimationTask
 from orquestra.quantum.measurements import ExpectationValues
 from orquestra.quantum.openfermion import QubitOperator
-from orquestra.quantum.utils import scale_and_discretize
 
 from orquestra.vqa.grouping._grouping import compute_group_variances
 
@@ -25,11 +23,11 @@ def allocate_shots_uniformly(
     if number_of_shots <= 0:
         raise ValueError("number_of_shots must be positive.")
 
+    # Positional arguments are noticeably cheaper than keywords for dataclasses, and
+    # much cheaper than dataclasses.replace, which inspects fields on every call.
     return [
         EstimationTask(
-            operator=estimation_task.operator,
-            circuit=estimation_task.circuit,
-            number_of_shots=number_of_shots,
+            estimation_task.operator, estimation_task.circuit, number_of_shots
         )
         for estimation_task in estimation_tasks
     ]
@@ -61,22 +59,56 @@ def allocate_shots_proportionally(
         frame_operators, prior_expectation_values
     )
 
-    measurements_per_frame = scale_and_discretize(
+    measurements_per_frame = _distribute_shots(
         relative_measurements_per_frame, total_n_shots
     )
 
     return [
-        EstimationTask(
-            operator=estimation_task.operator,
-            circuit=estimation_task.circuit,
-            number_of_shots=number_of_shots,
-        )
-        for estimation_task, number_of_shots in zip(
-            estimation_tasks, measurements_per_frame
+        EstimationTask(estimation_task.operator, estimation_task.circuit, n_shots)
+        for estimation_task, n_shots in zip(
+            estimation_tasks, measurements_per_frame.tolist()
         )
     ]
 
 
+def _distribute_shots(weights: np.ndarray, total_n_shots: int) -> np.ndarray:
+    """Splits total_n_shots into integers proportional to given weights.
+
+    Each element gets the floor of its proportional share, and the shots left over
+    are given to the elements with the largest fractional parts, so that the result
+    always sums up to total_n_shots.
+
+    Among elements with equal fractional parts, the ones with higher indices get the
+    extra shots first. Note that this differs from scale_and_discretize, which breaks
+    such ties in whatever order numpy's unstable argsort returns them.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    total_weight = weights.sum()
+    # A single check over the whole array, which also rejects NaNs
+    if not (total_weight > 0 and (weights >= 0).all()):
+        raise ValueError(
+            "Shots can only be allocated proportionally to non-negative weights "
+            "with a positive sum."
+        )
+    scaled_weights = weights * (total_n_shots / total_weight)
+    # Weights are non-negative, so modf splits them into remainders and floors
+    # in a single pass.
+    remainders, shots = np.modf(scaled_weights)
+    n_remaining_shots = int(round(total_n_shots - shots.sum()))
+    if n_remaining_shots > 0:
+        # Only the n_remaining_shots-th largest remainder is needed to find which
+        # elements get an extra shot, so partitioning is enough.
+        kth = n_remaining_shots - 1
+        threshold = -np.partition(-remainders, kth)[kth]
+        above_threshold = np.flatnonzero(remainders > threshold)
+        at_threshold = np.flatnonzero(remainders == threshold)
+        n_tied_shots = n_remaining_shots - len(above_threshold)
+        shots[above_threshold] += 1
+        shots[at_threshold[len(at_threshold) - n_tied_shots :]] += 1
+
+    return shots.astype(np.int64)
+
+
 def estimate_nmeas_for_frames(
     frame_operators: List[QubitOperator],
     expecval: Optional[ExpectationValues] = None,
@@ -111,10 +143,12 @@ def estimate_nmeas_for_frames(
         nterms (int): number of groups in frame_operators
         frame_meas (np.array): Number of optimal measurements per group
     """
-    frame_variances = compute_group_variances(frame_operators, expecval)
-    sqrt_lambda = sum(np.sqrt(frame_variances))
-    frame_meas = sqrt_lambda * np.sqrt(frame_variances)
-    K2 = sum(frame_meas)
-    nterms = sum([len(group.terms) for group in frame_operators])
+    nterms = sum(len(group.terms) for group in frame_operators)
+
+    frame_precisions = np.sqrt(compute_group_variances(frame_operators, expecval))
+    sqrt_lambda = frame_precisions.sum()
+    frame_meas = sqrt_lambda * frame_precisions
+    # Equal to the sum of frame_meas, without summing them again
+    K2 = sqrt_lambda**2
 
     return K2, nterms, frame_meas
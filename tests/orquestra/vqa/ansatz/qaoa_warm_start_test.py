@@ -119,6 +119,33 @@ class TestWarmStartQAOAAnsatz(AnsatzTests):
         # Then
         assert ansatz._parametrized_circuit is None
 
+    def test_set_thetas_modified_through_alias_invalidates_circuit(self, thetas):
+        # Given
+        ansatz = WarmStartQAOAAnsatz(
+            number_of_layers=1,
+            cost_hamiltonian=QubitOperator((0, "Z")) + QubitOperator((1, "Z")),
+            thetas=thetas,
+        )
+        _ = ansatz.parametrized_circuit
+        thetas[0] = 1.5
+
+        # When
+        ansatz.thetas = thetas.copy()
+
+        # Then
+        assert ansatz._parametrized_circuit is None
+
+    def test_get_executable_circuit_uses_symbols_of_current_circuit(self, ansatz):
+        # Given
+        ansatz.get_executable_circuit(np.zeros(ansatz.number_of_params))
+
+        # When
+        ansatz.number_of_layers += 1
+        circuit = ansatz.get_executable_circuit(np.zeros(ansatz.number_of_params))
+
+        # Then
+        assert circuit.free_symbols == []
+
     def test_get_number_of_qubits(self, ansatz):
         # Given
         new_cost_hamiltonian = (
@@ -1,6 +1,8 @@
 ################################################################################
 # © Copyright 2021-2022 Zapata Computing Inc.
 ################################################################################
+import math
+
 import numpy as np
 import pytest
 from orquestra.quantum.api.estimation import EstimationTask
@@ -79,4 +81,4 @@ class TestGibbsEstimator:
         )
 
         # Then
-        assert expectation_values[0].values == pytest.approx(target_value, abs=2e-2)
+        assert math.isclose(expectation_values[0].values[0], target_value, abs_tol=2e-2)
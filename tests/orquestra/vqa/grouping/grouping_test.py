@@ -249,6 +249,11 @@ def test_group_comeasureable_terms_greedy_sorted(
             ExpectationValues(np.array([1])),
             np.array([0.0]),
         ),
+        (
+            [QubitOperator(), QubitOperator("[Z0 Z1] + [Z0]"), QubitOperator()],
+            None,
+            np.array([0.0, 2.0, 0.0]),
+        ),
         (
             [
                 QubitOperator("2 [Z0 Z1] + 3 [Z0] + 8[]"),
@@ -257,6 +262,14 @@ def test_group_comeasureable_terms_greedy_sorted(
             ExpectationValues(np.asarray([0.0, 0.0, 1.0, 0, 0, 1.0])),
             np.array([13.0, 2.0]),
         ),
+        (
+            [
+                QubitOperator("Z0", np.complex128(1 + 2j))
+                + QubitOperator("Z1", np.complex128(0.5j))
+            ],
+            None,
+            np.array([-3.25 + 4j]),
+        ),
     ],
 )
 def test_compute_group_variances_with_ref(groups, expecval, variances):
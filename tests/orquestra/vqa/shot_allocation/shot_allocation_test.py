@@ -91,10 +91,26 @@ class TestShotAllocation:
         for task, target_n_samples in zip(new_estimation_tasks, target_n_samples_list):
             assert task.number_of_shots == target_n_samples
 
+    def test_allocate_shots_uniformly_preserves_operators_and_circuits(
+        self, frame_operators, circuits
+    ):
+        estimation_tasks = [
+            EstimationTask(operator, circuit, 1)
+            for operator, circuit in zip(frame_operators, circuits)
+        ]
+
+        new_estimation_tasks = allocate_shots_uniformly(estimation_tasks, 10)
+
+        assert new_estimation_tasks == [
+            EstimationTask(operator, circuit, 10)
+            for operator, circuit in zip(frame_operators, circuits)
+        ]
+
     @pytest.mark.parametrize(
         "total_n_shots, prior_expectation_values, target_n_samples_list",
         [
             (400, None, [200, 100, 100]),
+            (401, None, [201, 100, 100]),
             (400, ExpectationValues(np.array([0, 0, 0])), [200, 100, 100]),
             (400, ExpectationValues(np.array([1, 0.3, 0.3])), [0, 200, 200]),
         ],
@@ -121,6 +137,25 @@ class TestShotAllocation:
         for task, target_n_samples in zip(new_estimation_tasks, target_n_samples_list):
             assert task.number_of_shots == target_n_samples
 
+    @pytest.mark.parametrize(
+        "total_n_shots, target_n_samples_list",
+        [(4, [1, 1, 2]), (5, [1, 2, 2])],
+    )
+    def test_allocate_shots_proportionally_gives_tied_shots_to_later_tasks(
+        self, total_n_shots, target_n_samples_list
+    ):
+        estimation_tasks = [
+            EstimationTask(IsingOperator((qubit, "Z")), Circuit(), 1)
+            for qubit in range(3)
+        ]
+
+        new_estimation_tasks = allocate_shots_proportionally(
+            estimation_tasks, total_n_shots
+        )
+
+        for task, target_n_samples in zip(new_estimation_tasks, target_n_samples_list):
+            assert task.number_of_shots == target_n_samples
+
     @pytest.mark.parametrize(
         "n_samples",
         [-1],
@@ -150,6 +185,14 @@ class TestShotAllocation:
                 estimation_tasks, total_n_shots, prior_expectation_values
             )
 
+    def test_allocate_shots_proportionally_fails_when_all_variances_are_zero(self):
+        estimation_tasks = [
+            EstimationTask(IsingOperator("[]"), Circuit(), 1),
+            EstimationTask(IsingOperator("2 []"), Circuit(), 1),
+        ]
+        with pytest.raises(ValueError):
+            _ = allocate_shots_proportionally(estimation_tasks, 100)
+
 
 @pytest.mark.parametrize(
     "frame_operators, expecval, expected_result",